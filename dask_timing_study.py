@@ -14,156 +14,342 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import logging
+import os
 import sys
+import threading
 import time
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List
 
-from dask.distributed import Client, LocalCluster
+import dask
+from dask.distributed import Client, LocalCluster, Scheduler, SchedulerPlugin
 
+# orjson is optional; it serializes results considerably faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def measure_cluster_startup(n_workers: int = 2) -> Dict[str, float]:
+# Result keys that are not timing measurements
+NON_TIMING_KEYS = {'run', 'actual_workers', 'error', 'details', 'details_error'}
+
+# Per-worker fields reported by collect_cluster_details, always present in
+# the _scheduler_summary output
+_worker_fields = itemgetter('name', 'nthreads', 'memory_limit')
+
+
+# Task functions are defined once at module level rather than as a lambda
+# and a per-call closure, which keeps them readable and gives their tasks
+# stable, recognizable keys (e.g. '_square-<hash>' instead of 'lambda-<hash>')
+
+def _double(x):
+    """Simple task used to verify workers are ready."""
+    return x * 2
+
+
+def _square(x):
+    """Task used to measure task distribution throughput."""
+    return x ** 2
+
+
+class _WorkersReady(SchedulerPlugin):
     """
-    Measure the time it takes for a Dask cluster to start and become ready.
+    Scheduler plugin that sets an event once enough workers have joined.
+    
+    Only usable when the scheduler runs in this process, as with
+    LocalCluster. The event fires the moment the last worker registers
+    instead of on the next poll of Client.wait_for_workers. Registered
+    workers are counted: the scheduler calls this hook before a new worker
+    reports itself as running, so scheduler.running is not up to date here.
+    """
+    
+    def __init__(self, n_workers: int):
+        self.n_workers = n_workers
+        self.event = threading.Event()
+    
+    def add_worker(self, scheduler, worker):
+        if len(scheduler.workers) >= self.n_workers:
+            self.event.set()
+
+
+async def _add_scheduler_plugin(scheduler: Scheduler, plugin: SchedulerPlugin):
+    """Add a plugin to an in-process scheduler from within its event loop."""
+    scheduler.add_plugin(plugin)
+
+
+def _scheduler_summary(dask_scheduler) -> Dict[str, any]:
+    """
+    Summarize the scheduler and its workers, run on the scheduler.
+    
+    Returns the same 'id' and 'workers' layout as Client.scheduler_info(),
+    limited to the fields this script reports, so only a few bytes per
+    worker cross the wire instead of the full scheduler identity.
+    """
+    return {
+        'id': dask_scheduler.id,
+        'workers': {
+            address: {
+                'name': ws.name,
+                'nthreads': ws.nthreads,
+                'memory_limit': ws.memory_limit,
+            }
+            for address, ws in dask_scheduler.workers.items()
+        }
+    }
+
+
+def _dumps(obj) -> bytes:
+    """Serialize results to indented JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def collect_cluster_details(client: Client,
+                            scheduler_info: Dict[str, any] = None) -> Dict[str, any]:
+    """
+    Collect scheduler and worker information from a running cluster.
     
     Args:
-        n_workers: Number of workers to start
+        client: Client connected to a cluster whose workers are ready
+        scheduler_info: Scheduler summary from _scheduler_summary if the
+            caller already has it, to avoid another round-trip to the scheduler
         
     Returns:
-        Dictionary containing timing measurements in seconds
+        Dictionary containing worker details and task throughput
     """
-    timings = {}
-    
-    # Measure total cluster startup time
-    cluster_start = time.time()
-    
-    # Start cluster with specified number of workers
-    # Using LocalCluster for testing, but this approach works with other cluster types
-    cluster = LocalCluster(
-        n_workers=0,  # Start with no workers initially
-        threads_per_worker=1,
-        processes=True,
-        dashboard_address=None  # Disable dashboard for cleaner timing
-    )
+    info = {}
     
-    scheduler_ready = time.time()
-    timings['scheduler_startup'] = scheduler_ready - cluster_start
+    # Get scheduler info
+    if scheduler_info is None:
+        scheduler_info = client.run_on_scheduler(_scheduler_summary)
     
-    # Connect client to scheduler
-    client_start = time.time()
-    client = Client(cluster)
-    client_connected = time.time()
-    timings['client_connection'] = client_connected - client_start
+    info['n_workers'] = len(scheduler_info['workers'])
+    info['scheduler_id'] = scheduler_info['id']
     
-    # Scale up workers
-    workers_start = time.time()
-    cluster.scale(n_workers)
+    # Get worker details with timing information
+    workers = scheduler_info['workers']
+    info['workers'] = [
+        {
+            'id': worker_id,
+            'name': name,
+            'nthreads': nthreads,
+            'memory_limit': memory_limit,
+        }
+        for worker_id, (name, nthreads, memory_limit)
+        in zip(workers, map(_worker_fields, workers.values()))
+    ]
     
-    # Wait for all workers to connect
-    client.wait_for_workers(n_workers, timeout=60)
-    workers_ready = time.time()
-    timings['workers_startup'] = workers_ready - workers_start
+    # Measure task distribution timing
+    task_start = time.perf_counter()
     
-    # Measure time for first task execution (measures worker readiness)
-    first_task_start = time.time()
+    # Submit multiple tasks to test distribution
+    futures = client.map(_square, range(100))
+    # Fetch results straight from the workers rather than via the scheduler
+    results = client.gather(futures, direct=True)
     
-    # Simple task to verify workers are ready
-    def simple_task(x):
-        return x * 2
+    task_time = time.perf_counter() - task_start
+    info['task_execution_time'] = task_time
+    info['tasks_per_second'] = len(results) / task_time if task_time > 0 else 0
     
-    # Submit a task and wait for result
-    future = client.submit(simple_task, 1)
-    result = future.result()
+    return info
+
+
+def measure_cluster_startup(n_workers: int = 2,
+                            collect_detailed: bool = False,
+                            processes: bool = True,
+                            threads_per_worker: int = 1) -> Dict[str, any]:
+    """
+    Measure the time it takes for a Dask cluster to start and become ready.
     
-    first_task_complete = time.time()
-    timings['first_task_execution'] = first_task_complete - first_task_start
+    Args:
+        n_workers: Number of workers to start
+        collect_detailed: Also collect scheduler and worker details from the
+            cluster before it is shut down, stored under the 'details' key
+            (or the error message under 'details_error' if that fails)
+        processes: Run workers as separate processes rather than threads
+        threads_per_worker: Number of threads in each worker
+        
+    Returns:
+        Dictionary containing timing measurements in seconds, plus the
+        optional 'details' dictionary
+    """
+    timings = {}
     
-    # Calculate total time from start to first task completion
-    timings['total_cluster_ready'] = first_task_complete - cluster_start
+    # Measure total cluster startup time
+    cluster_start = time.perf_counter()
     
-    # Get additional cluster information
-    timings['actual_workers'] = len(client.scheduler_info()['workers'])
+    # Start cluster with specified number of workers
+    # Using LocalCluster for testing, but this approach works with other cluster
+    # types (worker readiness falls back to polling if the scheduler is remote)
+    cluster = LocalCluster(
+        n_workers=0,  # Start with no workers initially
+        threads_per_worker=threads_per_worker,
+        processes=processes,
+        dashboard_address=None,  # Disable dashboard for cleaner timing
+        silence_logs=logging.ERROR  # Keep log output out of the timed window
+    )
     
-    # Clean up
-    client.close()
-    cluster.close()
+    client = None
+    try:
+        scheduler_ready = time.perf_counter()
+        timings['scheduler_startup'] = scheduler_ready - cluster_start
+        
+        # Connect client to scheduler
+        client_start = time.perf_counter()
+        client = Client(cluster)
+        client_connected = time.perf_counter()
+        timings['client_connection'] = client_connected - client_start
+        
+        # Get notified by the scheduler as soon as all workers have registered,
+        # when the scheduler lives in this process. The scheduler's state is
+        # owned by the cluster's event loop thread, so the plugin is added
+        # from that loop rather than from this thread.
+        scheduler = getattr(cluster, 'scheduler', None)
+        workers_ready_plugin = None
+        if isinstance(scheduler, Scheduler):
+            workers_ready_plugin = _WorkersReady(n_workers)
+            cluster.sync(_add_scheduler_plugin, scheduler, workers_ready_plugin)
+        
+        # Scale up workers
+        workers_start = time.perf_counter()
+        cluster.scale(n_workers)
+        
+        # Wait for all workers to connect
+        if workers_ready_plugin is None:
+            client.wait_for_workers(n_workers, timeout=60)
+        elif not workers_ready_plugin.event.wait(timeout=60):
+            raise TimeoutError(f"Only {len(scheduler.workers)} of "
+                               f"{n_workers} workers registered within 60s")
+        workers_ready = time.perf_counter()
+        timings['workers_startup'] = workers_ready - workers_start
+        
+        # Measure time for first task execution (measures worker readiness)
+        first_task_start = time.perf_counter()
+        
+        # Submit a simple task and wait for result
+        future = client.submit(_double, 1)
+        result = future.result()
+        
+        first_task_complete = time.perf_counter()
+        timings['first_task_execution'] = first_task_complete - first_task_start
+        
+        # Calculate total time from start to first task completion
+        timings['total_cluster_ready'] = first_task_complete - cluster_start
+        
+        # Get additional cluster information, fetched once and reused below
+        scheduler_info = client.run_on_scheduler(_scheduler_summary)
+        timings['actual_workers'] = len(scheduler_info['workers'])
+        
+        # Reuse the running cluster rather than starting another one for details.
+        # A failure here must not discard the timings already measured.
+        if collect_detailed:
+            try:
+                details = {'setup_time': workers_ready - cluster_start}
+                details.update(collect_cluster_details(client, scheduler_info))
+                timings['details'] = details
+            except Exception as e:
+                timings['details_error'] = str(e)
+    finally:
+        # Clean up, even if a measurement failed
+        if client is not None:
+            client.close()
+        cluster.close()
     
     return timings
 
 
-def measure_scheduler_info(n_workers: int = 2) -> Dict[str, any]:
+def measure_scheduler_info(n_workers: int = 2, processes: bool = True,
+                           threads_per_worker: int = 1) -> Dict[str, any]:
     """
     Collect detailed scheduler and worker information.
     
     Args:
         n_workers: Number of workers to start
+        processes: Run workers as separate processes rather than threads
+        threads_per_worker: Number of threads in each worker
         
     Returns:
         Dictionary containing detailed timing and system information
     """
     info = {}
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Create cluster and client
     cluster = LocalCluster(
         n_workers=n_workers,
-        threads_per_worker=1,
-        processes=True,
-        dashboard_address=None
+        threads_per_worker=threads_per_worker,
+        processes=processes,
+        dashboard_address=None,
+        silence_logs=logging.ERROR
     )
     
     client = Client(cluster)
     client.wait_for_workers(n_workers, timeout=60)
     
-    setup_time = time.time() - start_time
+    setup_time = time.perf_counter() - start_time
     info['setup_time'] = setup_time
     
-    # Get scheduler info
-    scheduler_info = client.scheduler_info()
-    
-    info['n_workers'] = len(scheduler_info['workers'])
-    info['scheduler_id'] = scheduler_info['id']
+    info.update(collect_cluster_details(client))
     
-    # Get worker details with timing information
-    workers_info = []
-    for worker_id, worker_data in scheduler_info['workers'].items():
-        worker_info = {
-            'id': worker_id,
-            'name': worker_data.get('name', 'unknown'),
-            'nthreads': worker_data.get('nthreads', 0),
-            'memory_limit': worker_data.get('memory_limit', 0),
-        }
-        workers_info.append(worker_info)
+    # Clean up
+    client.close()
+    cluster.close()
     
-    info['workers'] = workers_info
+    return info
+
+
+def run_warmup(n_workers: int = 2, processes: bool = True,
+               threads_per_worker: int = 1) -> Dict[str, float]:
+    """
+    Run one untimed cluster startup so later runs start from a warm cache.
     
-    # Measure task distribution timing
-    task_start = time.time()
+    The first cluster started on a machine pays for loading dask and its
+    dependencies from a cold filesystem cache. This run absorbs that cost
+    so the timed runs measure the cluster itself.
     
-    # Submit multiple tasks to test distribution
-    futures = client.map(lambda x: x ** 2, range(100))
-    results = client.gather(futures)
+    Args:
+        n_workers: Number of workers to start
+        processes: Run workers as separate processes rather than threads
+        threads_per_worker: Number of threads in each worker
+        
+    Returns:
+        Timing dictionary for the cold-start run
+    """
+    print("Warm-up run (excluded from statistics)...", end=" ", flush=True)
     
-    task_time = time.time() - task_start
-    info['task_execution_time'] = task_time
-    info['tasks_per_second'] = len(results) / task_time if task_time > 0 else 0
+    try:
+        timings = measure_cluster_startup(n_workers, processes=processes,
+                                          threads_per_worker=threads_per_worker)
+        print(f"✓ (total cluster ready: {timings['total_cluster_ready']:.4f}s)")
+    except Exception as e:
+        print(f"✗ (Error: {e})")
+        timings = {'error': str(e)}
     
-    # Clean up
-    client.close()
-    cluster.close()
+    # Small delay to ensure clean shutdown before the timed runs
+    time.sleep(1)
     
-    return info
+    return timings
 
 
-def run_timing_study(n_workers: int = 2, n_runs: int = 1) -> List[Dict[str, float]]:
+def run_timing_study(n_workers: int = 2, n_runs: int = 1,
+                     collect_detailed: bool = False,
+                     processes: bool = True,
+                     threads_per_worker: int = 1) -> List[Dict[str, float]]:
     """
     Run multiple timing studies and collect results.
     
     Args:
         n_workers: Number of workers per run
         n_runs: Number of runs to perform
+        collect_detailed: Collect cluster details from the first successful run
+        processes: Run workers as separate processes rather than threads
+        threads_per_worker: Number of threads in each worker
         
     Returns:
         List of timing dictionaries, one per run
@@ -177,11 +363,16 @@ def run_timing_study(n_workers: int = 2, n_runs: int = 1) -> List[Dict[str, floa
         print(f"Run {run + 1}/{n_runs}...", end=" ", flush=True)
         
         try:
-            timings = measure_cluster_startup(n_workers)
+            timings = measure_cluster_startup(n_workers, collect_detailed, processes,
+                                              threads_per_worker)
             timings['run'] = run + 1
             results.append(timings)
             print("✓")
             
+            # Details are only needed once
+            if 'details' in timings:
+                collect_detailed = False
+            
             # Small delay between runs to ensure clean shutdown
             if run < n_runs - 1:
                 time.sleep(1)
@@ -209,9 +400,9 @@ def calculate_statistics(results: List[Dict[str, float]]) -> Dict[str, Dict[str,
     if not valid_results:
         return {}
     
-    # Get all timing keys (excluding 'run' and 'actual_workers')
+    # Get all timing keys (excluding non-timing keys such as 'run')
     timing_keys = [k for k in valid_results[0].keys() 
-                   if k not in ['run', 'actual_workers', 'error']]
+                   if k not in NON_TIMING_KEYS]
     
     statistics = {}
     
@@ -247,35 +438,40 @@ def print_results(results: List[Dict[str, float]], statistics: Dict[str, Dict[st
         results: List of timing dictionaries
         statistics: Dictionary with statistics for each timing metric
     """
-    print("\n" + "=" * 70)
-    print("DASK TIMING STUDY RESULTS")
-    print("=" * 70)
+    # Build the report in memory rather than issuing a write per line
+    buf = io.StringIO()
+    
+    print("\n" + "=" * 70, file=buf)
+    print("DASK TIMING STUDY RESULTS", file=buf)
+    print("=" * 70, file=buf)
     
     if not results:
-        print("No results to display.")
+        print("No results to display.", file=buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         return
     
     # Print individual run results
-    print("\nIndividual Runs:")
-    print("-" * 70)
+    print("\nIndividual Runs:", file=buf)
+    print("-" * 70, file=buf)
     
     for result in results:
         if 'error' in result:
-            print(f"Run {result['run']}: ERROR - {result['error']}")
+            print(f"Run {result['run']}: ERROR - {result['error']}", file=buf)
         else:
-            print(f"\nRun {result['run']}:")
-            print(f"  Scheduler startup:       {result['scheduler_startup']:.4f}s")
-            print(f"  Client connection:       {result['client_connection']:.4f}s")
-            print(f"  Workers startup:         {result['workers_startup']:.4f}s")
-            print(f"  First task execution:    {result['first_task_execution']:.4f}s")
-            print(f"  Total cluster ready:     {result['total_cluster_ready']:.4f}s")
-            print(f"  Workers connected:       {result.get('actual_workers', 'N/A')}")
+            print(f"\nRun {result['run']}:", file=buf)
+            print(f"  Scheduler startup:       {result['scheduler_startup']:.4f}s", file=buf)
+            print(f"  Client connection:       {result['client_connection']:.4f}s", file=buf)
+            print(f"  Workers startup:         {result['workers_startup']:.4f}s", file=buf)
+            print(f"  First task execution:    {result['first_task_execution']:.4f}s", file=buf)
+            print(f"  Total cluster ready:     {result['total_cluster_ready']:.4f}s", file=buf)
+            print(f"  Workers connected:       {result.get('actual_workers', 'N/A')}", file=buf)
     
     # Print statistics if multiple runs
     if statistics and len(results) > 1:
-        print("\n" + "-" * 70)
-        print("Statistics (across all successful runs):")
-        print("-" * 70)
+        print("\n" + "-" * 70, file=buf)
+        print("Statistics (across all successful runs):", file=buf)
+        print("-" * 70, file=buf)
         
         # Define order and labels for metrics
         metrics = [
@@ -286,8 +482,8 @@ def print_results(results: List[Dict[str, float]], statistics: Dict[str, Dict[st
             ('total_cluster_ready', 'Total Cluster Ready')
         ]
         
-        print(f"\n{'Metric':<25} {'Mean':>10} {'Min':>10} {'Max':>10} {'Std Dev':>10}")
-        print("-" * 70)
+        print(f"\n{'Metric':<25} {'Mean':>10} {'Min':>10} {'Max':>10} {'Std Dev':>10}", file=buf)
+        print("-" * 70, file=buf)
         
         for key, label in metrics:
             if key in statistics:
@@ -296,9 +492,37 @@ def print_results(results: List[Dict[str, float]], statistics: Dict[str, Dict[st
                       f"{stats['mean']:>9.4f}s "
                       f"{stats['min']:>9.4f}s "
                       f"{stats['max']:>9.4f}s "
-                      f"{stats['std_dev']:>9.4f}s")
+                      f"{stats['std_dev']:>9.4f}s", file=buf)
     
-    print("\n" + "=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    
+    # Emit the whole report in a single write
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
+def print_detailed_info(info: Dict[str, any]):
+    """
+    Print detailed scheduler and worker information.
+    
+    Args:
+        info: Dictionary as returned by collect_cluster_details, plus 'setup_time'
+    """
+    # Build the report in memory rather than issuing a write per line
+    buf = io.StringIO()
+    
+    print("\nDetailed Information:", file=buf)
+    print("-" * 70, file=buf)
+    print(f"Setup time:              {info['setup_time']:.4f}s", file=buf)
+    print(f"Number of workers:       {info['n_workers']}", file=buf)
+    print(f"Task execution time:     {info['task_execution_time']:.4f}s", file=buf)
+    print(f"Tasks per second:        {info['tasks_per_second']:.2f}", file=buf)
+    print(f"\nWorker Details:", file=buf)
+    for worker in info['workers']:
+        print(f"  - {worker['name']}: {worker['nthreads']} threads", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main():
@@ -312,6 +536,12 @@ def main():
         default=2,
         help='Number of workers to start (default: 2)'
     )
+    parser.add_argument(
+        '--threads-per-worker',
+        type=int,
+        default=1,
+        help='Number of threads in each worker (default: 1)'
+    )
     parser.add_argument(
         '--runs',
         type=int,
@@ -328,6 +558,30 @@ def main():
         action='store_true',
         help='Include detailed scheduler and worker information'
     )
+    parser.add_argument(
+        '--processes',
+        dest='processes',
+        action='store_true',
+        default=True,
+        help='Run workers as separate processes (default)'
+    )
+    parser.add_argument(
+        '--no-processes',
+        dest='processes',
+        action='store_false',
+        help='Run workers as threads in this process, skipping process startup'
+    )
+    parser.add_argument(
+        '--multiprocessing-method',
+        choices=['spawn', 'fork', 'forkserver'],
+        help='How worker processes are started (default: Dask configuration, '
+             'normally spawn); forkserver preloads dask and its dependencies once'
+    )
+    parser.add_argument(
+        '--warmup',
+        action='store_true',
+        help='Do one untimed warm-up run first so cold-start costs are excluded'
+    )
     
     args = parser.parse_args()
     
@@ -336,12 +590,39 @@ def main():
         print("Error: Number of workers must be at least 1", file=sys.stderr)
         sys.exit(1)
     
+    if args.threads_per_worker < 1:
+        print("Error: Number of threads per worker must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    
     if args.runs < 1:
         print("Error: Number of runs must be at least 1", file=sys.stderr)
         sys.exit(1)
     
+    # More worker threads than cores makes workers contend for the CPU,
+    # which shows up as noise in the timings
+    cpu_count = os.cpu_count() or 1
+    if args.workers * args.threads_per_worker > cpu_count:
+        print(f"Warning: {args.workers} workers x {args.threads_per_worker} threads "
+              f"oversubscribes {cpu_count} CPUs; timings may be noisy", file=sys.stderr)
+    
+    # Worker processes are started by the nanny using this configuration
+    if args.multiprocessing_method:
+        dask.config.set({
+            'distributed.worker.multiprocessing-method': args.multiprocessing_method
+        })
+    
+    # Optionally absorb cold-start costs before the timed runs
+    warmup = (run_warmup(args.workers, args.processes, args.threads_per_worker)
+              if args.warmup else None)
+    
     # Run timing studies
-    results = run_timing_study(n_workers=args.workers, n_runs=args.runs)
+    results = run_timing_study(
+        n_workers=args.workers,
+        n_runs=args.runs,
+        collect_detailed=args.detailed,
+        processes=args.processes,
+        threads_per_worker=args.threads_per_worker
+    )
     
     # Calculate statistics if multiple runs
     statistics = calculate_statistics(results) if args.runs > 1 else {}
@@ -349,22 +630,17 @@ def main():
     # Print results to console
     print_results(results, statistics)
     
-    # Optionally get detailed information
+    # Optionally show detailed information gathered during the runs
     if args.detailed:
-        print("\nCollecting detailed cluster information...")
-        try:
-            detailed_info = measure_scheduler_info(n_workers=args.workers)
-            print("\nDetailed Information:")
-            print("-" * 70)
-            print(f"Setup time:              {detailed_info['setup_time']:.4f}s")
-            print(f"Number of workers:       {detailed_info['n_workers']}")
-            print(f"Task execution time:     {detailed_info['task_execution_time']:.4f}s")
-            print(f"Tasks per second:        {detailed_info['tasks_per_second']:.2f}")
-            print(f"\nWorker Details:")
-            for worker in detailed_info['workers']:
-                print(f"  - {worker['name']}: {worker['nthreads']} threads")
-        except Exception as e:
-            print(f"Error collecting detailed information: {e}", file=sys.stderr)
+        detailed_info = next((r['details'] for r in results if 'details' in r), None)
+        if detailed_info is None:
+            # Report why the last attempt failed, if any run got that far
+            reason = next((r['details_error'] for r in reversed(results)
+                           if 'details_error' in r), 'no successful runs')
+            print(f"Error collecting detailed information: {reason}",
+                  file=sys.stderr)
+        else:
+            print_detailed_info(detailed_info)
     
     # Save to JSON if requested
     if args.output:
@@ -372,15 +648,25 @@ def main():
             'timestamp': datetime.now().isoformat(),
             'parameters': {
                 'workers': args.workers,
-                'runs': args.runs
+                'threads_per_worker': args.threads_per_worker,
+                'runs': args.runs,
+                'processes': args.processes,
+                # Only meaningful when worker processes are started
+                'multiprocessing_method': dask.config.get(
+                    'distributed.worker.multiprocessing-method'
+                ) if args.processes else None,
+                'warmup': args.warmup
             },
             'results': results,
             'statistics': statistics
         }
         
+        if warmup is not None:
+            output_data['warmup'] = warmup
+        
         try:
-            with open(args.output, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(_dumps(output_data))
             print(f"\nResults saved to: {args.output}")
         except Exception as e:
             print(f"Error saving results: {e}", file=sys.stderr)
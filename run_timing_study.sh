@@ -94,9 +94,15 @@ Commands:
 
 Custom Options (for 'custom' command):
     -w, --workers N     Number of workers (default: 2)
+    --threads-per-worker N
+                        Threads in each worker (default: 1)
     -r, --runs N        Number of runs (default: 1)
     -o, --output FILE   Output JSON file
     -d, --detailed      Include detailed information
+    --no-processes      Use threaded workers instead of processes
+    --multiprocessing-method M
+                        Start worker processes with spawn, fork or forkserver
+    --warmup            Do one untimed warm-up run first
 
 Examples:
     $0 quick